@@ -1,20 +1,60 @@
 
 import os
+import shlex
 import shutil
+import random
 import argparse
+import subprocess
+from pathlib import Path
 
 parser = argparse.ArgumentParser(description="Run cocotb tests")
 parser.add_argument("-extend", help="extend the command")
+parser.add_argument("-dump", action="store_true", help="dump waveforms (disabled by default)")
+parser.add_argument("-seed", default="1762087232", help="seed to rerun with, or 'random' for a fresh one")
 args = parser.parse_args()
 
-os.environ["CARAVEL_ROOT"] = "/home/marcus/caravel_rtl_fix/caravel"
-os.environ["MCW_ROOT"] = "/home/marcus/caravel_rtl_fix/mgmt_core_wrapper"
+if os.environ.get("CARAVEL_REPO"):
+    REPO = Path(os.environ["CARAVEL_REPO"])
+else:
+    # reruns live under <repo>/verilog/dv/cocotb/sim/, possibly nested
+    sim_dir = next((p for p in Path(__file__).resolve().parents if p.name == "sim"), None)
+    if sim_dir is None:
+        parser.error("not under verilog/dv/cocotb/sim/; set CARAVEL_REPO")
+    REPO = sim_dir.parents[3]
+COCOTB_DIR = REPO / "verilog" / "dv" / "cocotb"
+TAG = "run_02_Nov_04_40_06_64/RTL-mat_mult_status/rerun"
 
-os.chdir("/home/marcus/caravel_rtl_fix/verilog/dv/cocotb")
+env = {
+    **os.environ,
+    "CARAVEL_ROOT": str(REPO / "caravel"),
+    "MCW_ROOT": str(REPO / "mgmt_core_wrapper"),
+}
+# cocotb enables profiling whenever the variable is set, whatever its value
+if env.get("PROFILE", "0") != "0":
+    env["COCOTB_ENABLE_PROFILING"] = "1"
 
-command = "python3 /home/marcus/caravel_rtl_fix/venv-cocotb/bin/caravel_cocotb -test mat_mult_status -tag run_02_Nov_04_40_06_64/RTL-mat_mult_status/rerun   -sim RTL -corner nom-t  -seed 1762087232 "
-if args.extend is not None:
-    command += f" {args.extend}"
-os.system(command)
+rerun_src = COCOTB_DIR / "sim" / "run_02_Nov_04_40_06_64" / "RTL-mat_mult_status" / "rerun.py"
+rerun_copy = COCOTB_DIR / "sim" / TAG / "RTL-mat_mult_status" / "rerun.py"
+os.makedirs(rerun_copy.parent, exist_ok=True)
+# drop the link from a previous rerun so caravel_cocotb cannot write its
+# generated rerun.py through it into rerun_src
+rerun_copy.unlink(missing_ok=True)
 
-shutil.copyfile("/home/marcus/caravel_rtl_fix/verilog/dv/cocotb/sim/run_02_Nov_04_40_06_64/RTL-mat_mult_status/rerun.py", "/home/marcus/caravel_rtl_fix/verilog/dv/cocotb/sim/run_02_Nov_04_40_06_64/RTL-mat_mult_status/rerun/RTL-mat_mult_status/rerun.py")
+seed = str(random.SystemRandom().randint(0, 2**31 - 1)) if args.seed == "random" else args.seed
+command = ["python3", str(REPO / "venv-cocotb" / "bin" / "caravel_cocotb"), "-test", "mat_mult_status", "-tag", TAG, "-sim", "RTL", "-corner", "nom-t", "-seed", seed]
+if not args.dump:
+    command.append("-no_wave")
+if "COCOTB_ENABLE_PROFILING" in env:
+    # the docker run does not forward the environment
+    command.append("-no_docker")
+if args.extend is not None:
+    command += shlex.split(args.extend)
+try:
+    subprocess.run(command, cwd=COCOTB_DIR, env=env, check=True)
+finally:
+    if rerun_src.exists():
+        rerun_copy.unlink(missing_ok=True)
+        try:
+            os.link(rerun_src, rerun_copy)
+        except OSError:
+            shutil.copyfile(rerun_src, rerun_copy)
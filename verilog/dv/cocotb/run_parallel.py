@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# Run the tests of a caravel_cocotb test list as parallel simulator jobs.
+#
+# Every test gets its own tag (sim/<tag>/<test>/) and its own seed, so the
+# jobs share no working directory. Each test runs with the sim view (RTL
+# by default) and corner its list entry gives. Seeds are drawn at random
+# unless -seed is given, in which case test N uses seed + N, wrapped to
+# 0..2**31-1. Waves are only dumped with -dump.
+#
+#   python3 run_parallel.py -tl user_proj_tests/mat_mult_tests.yaml -jobs 6
+
+import argparse
+import random
+import shlex
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+COCOTB_DIR = Path(__file__).resolve().parent
+CARAVEL_COCOTB = COCOTB_DIR.parents[2] / "venv-cocotb" / "bin" / "caravel_cocotb"
+
+parser = argparse.ArgumentParser(description="Run cocotb tests in parallel")
+parser.add_argument("-tl", default="user_proj_tests/mat_mult_tests.yaml", help="test list yaml")
+parser.add_argument("-jobs", type=int, default=6, help="number of simulations to run at once")
+parser.add_argument("-seed", type=int, help="base seed (random per test if omitted)")
+parser.add_argument("-tag", default=datetime.now().strftime("run_%d_%b_%H_%M_%S"), help="results directory under sim/")
+parser.add_argument("-dump", action="store_true", help="dump waveforms (disabled by default)")
+parser.add_argument("-extend", help="extra caravel_cocotb arguments for every test")
+args = parser.parse_args()
+
+with open(COCOTB_DIR / args.tl) as f:
+    tests = yaml.safe_load(f)["Tests"]
+
+if args.seed is None:
+    rng = random.SystemRandom()
+    seeds = [rng.randint(0, 2**31 - 1) for _ in tests]
+else:
+    seeds = [(args.seed + i) % 2**31 for i in range(len(tests))]
+
+
+def run(entry, seed):
+    test = entry["name"]
+    command = [str(CARAVEL_COCOTB), "-test", test, "-tag", f"{args.tag}/{test}", "-seed", str(seed)]
+    command += ["-sim", entry.get("sim", "RTL")]
+    if "corner" in entry:
+        command += ["-corner", entry["corner"]]
+    if not args.dump:
+        command.append("-no_wave")
+    if args.extend is not None:
+        command += shlex.split(args.extend)
+    subprocess.run(command, cwd=COCOTB_DIR)
+    # caravel_cocotb marks a passing test with a 'passed' file in its run dir
+    return any((COCOTB_DIR / "sim" / args.tag / test).glob(f"*-{test}/passed"))
+
+
+with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+    results = list(pool.map(run, tests, seeds))
+
+for entry, seed, passed in zip(tests, seeds, results):
+    print(f"{'PASS' if passed else 'FAIL'}  {entry['name']}  seed={seed}")
+sys.exit(0 if all(results) else 1)
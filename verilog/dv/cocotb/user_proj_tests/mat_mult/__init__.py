@@ -0,0 +1,6 @@
+from user_proj_tests.mat_mult.mat_mult_tests import mat_mult_version
+from user_proj_tests.mat_mult.mat_mult_tests import mat_mult_status
+from user_proj_tests.mat_mult.mat_mult_tests import mat_mult_reset
+from user_proj_tests.mat_mult.mat_mult_tests import mat_mult_identity
+from user_proj_tests.mat_mult.mat_mult_tests import mat_mult_unsigned
+from user_proj_tests.mat_mult.mat_mult_tests import mat_mult_full
@@ -29,8 +29,16 @@ void *memset(void *s, int c, size_t n)
 #define STATUS_DONE       (1 << 1)
 #define STATUS_STICKY_DONE (1 << 3)
 #define MATRIX_SIZE       8
+#define MATRIX_WORDS      (MATRIX_SIZE * MATRIX_SIZE / 4)
 #define MAX_POLL_CYCLES   2000
 
+// Row-major int8 elements; on little-endian RV32 each word holds four
+// consecutive elements in the order the matrix cache expects
+typedef union {
+    int8_t   e[MATRIX_SIZE][MATRIX_SIZE];
+    uint32_t w[MATRIX_WORDS];
+} matrix_t;
+
 static inline void wait_cycles(uint32_t cycles)
 {
     for (uint32_t i = 0; i < cycles; i++) {
@@ -38,35 +46,12 @@ static inline void wait_cycles(uint32_t cycles)
     }
 }
 
-static inline uint32_t pack_elements(int8_t e0, int8_t e1, int8_t e2, int8_t e3)
-{
-    return ((uint32_t)(uint8_t)e0) | (((uint32_t)(uint8_t)e1) << 8) |
-           (((uint32_t)(uint8_t)e2) << 16) | (((uint32_t)(uint8_t)e3) << 24);
-}
-
-void write_matrix_a(int8_t matrix[MATRIX_SIZE][MATRIX_SIZE])
-{
-    volatile uint32_t *cache = (volatile uint32_t *)MATMUL_A_BASE;
-    for (int row = 0; row < MATRIX_SIZE; row++) {
-        for (int col = 0; col < MATRIX_SIZE; col += 4) {
-            cache[row * 2 + col/4] = pack_elements(
-                matrix[row][col], matrix[row][col+1],
-                matrix[row][col+2], matrix[row][col+3]
-            );
-        }
-    }
-}
-
-void write_matrix_b(int8_t matrix[MATRIX_SIZE][MATRIX_SIZE])
+// Copy a matrix into a cache with back-to-back word stores
+void write_matrix(uint32_t base, const matrix_t *matrix)
 {
-    volatile uint32_t *cache = (volatile uint32_t *)MATMUL_B_BASE;
-    for (int row = 0; row < MATRIX_SIZE; row++) {
-        for (int col = 0; col < MATRIX_SIZE; col += 4) {
-            cache[row * 2 + col/4] = pack_elements(
-                matrix[row][col], matrix[row][col+1],
-                matrix[row][col+2], matrix[row][col+3]
-            );
-        }
+    volatile uint32_t *cache = (volatile uint32_t *)base;
+    for (int i = 0; i < MATRIX_WORDS; i++) {
+        cache[i] = matrix->w[i];
     }
 }
 
@@ -86,25 +71,24 @@ void main()
 {
     ManagmentGpio_outputEnable();
     ManagmentGpio_write(0);
-    GPIOs_configureAll(GPIO_MODE_USER_STD_OUT_MONITORED);
-    GPIOs_loadConfigs();
+    // user GPIOs stay at their power-on defaults
     User_enableIF(1);
     ManagmentGpio_write(1);
     wait_cycles(100);
 
-    int8_t mat_a[MATRIX_SIZE][MATRIX_SIZE];
-    int8_t mat_b[MATRIX_SIZE][MATRIX_SIZE];
+    matrix_t mat_a;
+    matrix_t mat_b;
 
     // Fill matrices with sequential values [0..63]
     for (int i = 0; i < MATRIX_SIZE; i++) {
         for (int j = 0; j < MATRIX_SIZE; j++) {
-            mat_a[i][j] = i * MATRIX_SIZE + j;
-            mat_b[i][j] = i * MATRIX_SIZE + j;
+            mat_a.e[i][j] = i * MATRIX_SIZE + j;
+            mat_b.e[i][j] = i * MATRIX_SIZE + j;
         }
     }
 
-    write_matrix_a(mat_a);
-    write_matrix_b(mat_b);
+    write_matrix(MATMUL_A_BASE, &mat_a);
+    write_matrix(MATMUL_B_BASE, &mat_b);
 
     // Start signed multiplication
     *((volatile uint32_t *)MATMUL_CTRL) = CTRL_START | CTRL_SIGNED;
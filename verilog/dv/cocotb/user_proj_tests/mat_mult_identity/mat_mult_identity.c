@@ -43,8 +43,16 @@ void *memset(void *s, int c, size_t n)
 #define STATUS_STICKY_DONE (1 << 3)
 
 #define MATRIX_SIZE       8
+#define MATRIX_WORDS      (MATRIX_SIZE * MATRIX_SIZE / 4)
 #define MAX_POLL_CYCLES   1000
 
+// Row-major int8 elements; on little-endian RV32 each word holds four
+// consecutive elements in the order the matrix cache expects
+typedef union {
+    int8_t   e[MATRIX_SIZE][MATRIX_SIZE];
+    uint32_t w[MATRIX_WORDS];
+} matrix_t;
+
 // Simple delay
 static inline void wait_cycles(uint32_t cycles)
 {
@@ -53,48 +61,13 @@ static inline void wait_cycles(uint32_t cycles)
     }
 }
 
-// Pack 4 8-bit elements into 32-bit word
-static inline uint32_t pack_elements(int8_t e0, int8_t e1, int8_t e2, int8_t e3)
-{
-    return ((uint32_t)(uint8_t)e0) |
-           (((uint32_t)(uint8_t)e1) << 8) |
-           (((uint32_t)(uint8_t)e2) << 16) |
-           (((uint32_t)(uint8_t)e3) << 24);
-}
-
-// Write 8x8 matrix to cache A
-void write_matrix_a(int8_t matrix[MATRIX_SIZE][MATRIX_SIZE])
+// Copy a matrix into a cache with back-to-back word stores
+void write_matrix(uint32_t base, const matrix_t *matrix)
 {
-    volatile uint32_t *cache = (volatile uint32_t *)MATMUL_A_BASE;
+    volatile uint32_t *cache = (volatile uint32_t *)base;
 
-    for (int row = 0; row < MATRIX_SIZE; row++) {
-        for (int col = 0; col < MATRIX_SIZE; col += 4) {
-            uint32_t packed = pack_elements(
-                matrix[row][col],
-                matrix[row][col+1],
-                matrix[row][col+2],
-                matrix[row][col+3]
-            );
-            cache[row * 2 + col/4] = packed;
-        }
-    }
-}
-
-// Write 8x8 matrix to cache B
-void write_matrix_b(int8_t matrix[MATRIX_SIZE][MATRIX_SIZE])
-{
-    volatile uint32_t *cache = (volatile uint32_t *)MATMUL_B_BASE;
-
-    for (int row = 0; row < MATRIX_SIZE; row++) {
-        for (int col = 0; col < MATRIX_SIZE; col += 4) {
-            uint32_t packed = pack_elements(
-                matrix[row][col],
-                matrix[row][col+1],
-                matrix[row][col+2],
-                matrix[row][col+3]
-            );
-            cache[row * 2 + col/4] = packed;
-        }
+    for (int i = 0; i < MATRIX_WORDS; i++) {
+        cache[i] = matrix->w[i];
     }
 }
 
@@ -146,8 +119,7 @@ void main()
     // Initialize hardware
     ManagmentGpio_outputEnable();
     ManagmentGpio_write(0);
-    GPIOs_configureAll(GPIO_MODE_USER_STD_OUT_MONITORED);
-    GPIOs_loadConfigs();
+    // user GPIOs stay at their power-on defaults
     User_enableIF(1);
 
     // Signal ready to cocotb
@@ -155,27 +127,27 @@ void main()
     wait_cycles(100);
 
     // Create matrices
-    int8_t mat_a[MATRIX_SIZE][MATRIX_SIZE];
-    int8_t mat_b[MATRIX_SIZE][MATRIX_SIZE];
+    matrix_t mat_a;
+    matrix_t mat_b;
     int32_t result[MATRIX_SIZE][MATRIX_SIZE];
 
     // Initialize to zero
-    memset(mat_a, 0, sizeof(mat_a));
-    memset(mat_b, 0, sizeof(mat_b));
+    memset(&mat_a, 0, sizeof(mat_a));
+    memset(&mat_b, 0, sizeof(mat_b));
 
     // A = 2x2 identity in top-left corner
-    mat_a[0][0] = 1;
-    mat_a[1][1] = 1;
+    mat_a.e[0][0] = 1;
+    mat_a.e[1][1] = 1;
 
     // B = simple 2x2 matrix
-    mat_b[0][0] = 5;
-    mat_b[0][1] = 6;
-    mat_b[1][0] = 7;
-    mat_b[1][1] = 8;
+    mat_b.e[0][0] = 5;
+    mat_b.e[0][1] = 6;
+    mat_b.e[1][0] = 7;
+    mat_b.e[1][1] = 8;
 
     // Write matrices to accelerator
-    write_matrix_a(mat_a);
-    write_matrix_b(mat_b);
+    write_matrix(MATMUL_A_BASE, &mat_a);
+    write_matrix(MATMUL_B_BASE, &mat_b);
 
     // Start computation (signed mode)
     start_multiplication(1);
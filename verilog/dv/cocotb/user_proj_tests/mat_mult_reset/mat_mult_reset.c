@@ -35,8 +35,7 @@ void main()
 {
     ManagmentGpio_outputEnable();
     ManagmentGpio_write(0);
-    GPIOs_configureAll(GPIO_MODE_USER_STD_OUT_MONITORED);
-    GPIOs_loadConfigs();
+    // user GPIOs stay at their power-on defaults
     User_enableIF(1);
     ManagmentGpio_write(1);
     wait_cycles(100);
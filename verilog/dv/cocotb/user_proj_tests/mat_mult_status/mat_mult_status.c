@@ -48,8 +48,7 @@ void main()
     // Initialize hardware
     ManagmentGpio_outputEnable();
     ManagmentGpio_write(0);
-    GPIOs_configureAll(GPIO_MODE_USER_STD_OUT_MONITORED);
-    GPIOs_loadConfigs();
+    // user GPIOs stay at their power-on defaults
 
     // Enable Wishbone interface to user project
     User_enableIF(1);